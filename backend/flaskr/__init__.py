@@ -1,18 +1,93 @@
 import os
+import time
+import click
+from threading import Thread
 from flask import Flask, request, abort, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from random import randint
 
-from models import setup_db, Question, Category
+from models import setup_db, create_db, check_db, db, Question, Category
 
 QUESTIONS_PER_PAGE = 10
 
 def create_app(test_config=None):
   # create and configure the app
+  started_at = time.perf_counter()
   app = Flask(__name__)
-  setup_db(app)
-  
+  app.config['WARM_CACHES'] = True
+  if test_config is not None:
+    app.config.update(test_config)
+
+  if 'DATABASE_PATH' in app.config:
+    setup_db(app, app.config['DATABASE_PATH'])
+  else:
+    setup_db(app)
+
+  '''
+  Schema creation is no longer done on startup, run it explicitly
+  with `flask create-db` before serving against a fresh database.
+  '''
+  @app.cli.command('create-db')
+  def create_db_command():
+    create_db()
+    click.echo('Database tables created.')
+
+  '''
+  Categories are cached in memory and warmed in a background thread when
+  the app boots to serve requests, so boot never waits on the database.
+  CLI commands other than `flask run` skip the warm-up. Handlers fall
+  back to querying on a miss.
+  No endpoint modifies categories, so the cache is never invalidated and
+  lives for the lifetime of the process; restart workers after editing
+  categories directly in the database.
+  '''
+  cache = {
+    'categories': None
+  }
+
+  def get_formatted_categories():
+    if cache['categories'] is not None:
+      return cache['categories']
+
+    categories = Category.query.order_by(Category.id).all()
+    formatted_categories = [category.format() for category in categories]
+
+    # don't cache an empty result, the database may not be restored yet
+    if len(formatted_categories) > 0:
+      cache['categories'] = formatted_categories
+
+    return formatted_categories
+
+  startup = {
+    'startup_seconds': None,
+    'warm_up_seconds': None
+  }
+
+  def warm_caches():
+    warm_started_at = time.perf_counter()
+    with app.app_context():
+      try:
+        get_formatted_categories()
+      except Exception:
+        app.logger.exception('Cache warm-up failed, caches will fill on demand')
+        return
+      finally:
+        db.session.remove()
+
+    if cache['categories'] is None:
+      app.logger.warning('Cache warm-up found no categories, caches will fill on demand')
+      return
+
+    startup['warm_up_seconds'] = round(time.perf_counter() - warm_started_at, 4)
+    app.logger.info('Cache warm-up finished in %ss', startup['warm_up_seconds'])
+
+  def is_serving():
+    # CLI commands load the app inside a click context, `flask run` and
+    # WSGI servers either have no context or run under the `run` command
+    ctx = click.get_current_context(silent=True)
+    return ctx is None or ctx.info_name == 'run'
+
   '''
  `Set up CORS. Allow '*' for origins. Delete the sample route after completing the TODOs
   '''
@@ -46,8 +121,7 @@ def create_app(test_config=None):
   '''
   @app.route('/categories', methods=['GET'])
   def get_categories():
-    categories = Category.query.order_by(Category.id).all()
-    formatted_categories = [category.format() for category in categories]
+    formatted_categories = get_formatted_categories()
         
     if len(formatted_categories) == 0:
       abort(404)
@@ -94,8 +168,7 @@ def create_app(test_config=None):
     
     current_questions = paginate_questions(request, selection)
     
-    categories = Category.query.order_by(Category.id).all()
-    formatted_categories = [category.format() for category in categories]
+    formatted_categories = get_formatted_categories()
     
     if len(current_questions) == 0:
         abort(404)
@@ -269,6 +342,33 @@ def create_app(test_config=None):
     except:
       abort(422)
 
+  '''
+  Readiness endpoint, verifies database connectivity on demand
+  and reports startup and cache warm-up timings. While caches are
+  enabled but still cold it tries to fill them and reports 503 until
+  that succeeds, so a failed boot warm-up recovers once the database
+  is back.
+  '''
+  @app.route('/ready', methods=['GET'])
+  def ready():
+    try:
+      check_db()
+      if app.config['WARM_CACHES']:
+        get_formatted_categories()
+    except Exception:
+      db.session.rollback()
+      abort(503)
+
+    if app.config['WARM_CACHES'] and cache['categories'] is None:
+      abort(503)
+
+    return jsonify({
+        'success': True,
+        'startup_seconds': startup['startup_seconds'],
+        'warm_up_seconds': startup['warm_up_seconds'],
+        'caches_warm': cache['categories'] is not None
+    })
+
   '''
   Create error handlers for all expected errors 
   including 404 and 422. 
@@ -305,6 +405,20 @@ def create_app(test_config=None):
           "message": "internal server error"
       }), 500
 
+  @app.errorhandler(503)
+  def service_unavailable(error):
+      return jsonify({
+          "success": False,
+          "error": 503,
+          "message": "service unavailable"
+      }), 503
+
+  startup['startup_seconds'] = round(time.perf_counter() - started_at, 4)
+  app.logger.info('App created in %ss', startup['startup_seconds'])
+
+  if app.config['WARM_CACHES'] and is_serving():
+    Thread(target=warm_caches, daemon=True).start()
+
   return app
 
     
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import Column, String, Integer, create_engine, exc
+from sqlalchemy import Column, String, Integer, create_engine, exc, text
 from flask_sqlalchemy import SQLAlchemy
 import json
 
@@ -11,14 +11,28 @@ db = SQLAlchemy()
 '''
 setup_db(app)
     binds a flask application and a SQLAlchemy service
+    without touching the database, so startup does not depend on it
 '''
 def setup_db(app, database_path=database_path):
     app.config["SQLALCHEMY_DATABASE_URI"] = database_path
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     db.app = app
     db.init_app(app)
+
+'''
+create_db()
+    creates any missing tables, run explicitly through `flask create-db`
+'''
+def create_db():
     db.create_all()
 
+'''
+check_db()
+    issues a trivial query to verify the database is reachable
+'''
+def check_db():
+    db.session.execute(text('SELECT 1'))
+
 '''
 Question
 
@@ -1,10 +1,11 @@
 import os
+import time
 import unittest
 import json
-from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
 
 from flaskr import create_app
-from models import setup_db, Question, Category
+from models import create_db, db, Question, Category
 
 
 class TriviaTestCase(unittest.TestCase):
@@ -12,19 +13,13 @@ class TriviaTestCase(unittest.TestCase):
 
     def setUp(self):
         """Define test variables and initialize app."""
-        self.app = create_app()
-        self.client = self.app.test_client
         self.database_name = "trivia_test"
         self.database_path = "postgresql://{}/{}".format('localhost:5432', self.database_name)
-        setup_db(self.app, self.database_path)
-
-        # binds the app to the current context
-        with self.app.app_context():
-            self.db = SQLAlchemy()
-            self.db.init_app(self.app)
-            
-            # create all tables
-            self.db.create_all()
+        self.app = create_app({
+            'DATABASE_PATH': self.database_path,
+            'WARM_CACHES': False
+        })
+        self.client = self.app.test_client
 
         self.new_question = {
             "question": "Whose autobiography is entitled 'Catcher in the Rye'?",
@@ -275,6 +270,116 @@ class TriviaTestCase(unittest.TestCase):
         self.assertEqual(data['message'], 'unprocessable')
 
 
+    '''
+    GET '/ready' tests
+    '''
+    # Success: Database reachable and startup time reported
+    def test_ready(self):
+        res = self.client().get('/ready')
+        data = json.loads(res.data)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(data['success'], True)
+        self.assertIsNotNone(data['startup_seconds'])
+
+    # Error: App still starts with database down, readiness reports unavailable
+    def test_503_if_database_unreachable(self):
+        app = create_app({
+            'DATABASE_PATH': "postgresql://{}/{}".format('localhost:1', self.database_name),
+            'WARM_CACHES': False
+        })
+        res = app.test_client().get('/ready')
+        data = json.loads(res.data)
+
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['message'], 'service unavailable')
+
+    # Success: Warm-up started on boot fills the categories cache
+    def test_ready_after_warm_up(self):
+        app = create_app({
+            'DATABASE_PATH': self.database_path,
+            'WARM_CACHES': True
+        })
+        res, data = self.wait_for_warm_up(app)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(data['success'], True)
+        self.assertEqual(data['caches_warm'], True)
+        self.assertIsNotNone(data['warm_up_seconds'])
+
+    # Error: Readiness reports unavailable while caches are cold
+    def test_503_if_caches_cold(self):
+        app = create_app({
+            'DATABASE_PATH': 'sqlite://',
+            'WARM_CACHES': True
+        })
+
+        with app.app_context():
+            create_db()
+
+        res = app.test_client().get('/ready')
+        data = json.loads(res.data)
+
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['message'], 'service unavailable')
+
+    # Success: Categories are served from the cache for the process lifetime
+    def test_categories_served_from_cache(self):
+        app = create_app({
+            'DATABASE_PATH': self.database_path,
+            'WARM_CACHES': True
+        })
+        self.wait_for_warm_up(app)
+        categories = Category.query.count()
+
+        category = Category(type='Cached')
+        db.session.add(category)
+        db.session.commit()
+
+        try:
+            categories_res = app.test_client().get('/categories')
+            categories_data = json.loads(categories_res.data)
+            questions_res = app.test_client().get('/questions')
+            questions_data = json.loads(questions_res.data)
+        finally:
+            db.session.delete(category)
+            db.session.commit()
+
+        self.assertEqual(categories_data['total_categories'], categories)
+        self.assertEqual(len(questions_data['categories']), categories)
+
+    '''
+    create_db() tests
+    '''
+    # Success: Tables are created explicitly, not on app creation
+    def test_create_db_creates_tables(self):
+        app = create_app({
+            'DATABASE_PATH': 'sqlite://',
+            'WARM_CACHES': False
+        })
+
+        with app.app_context():
+            self.assertEqual(inspect(db.engine).get_table_names(), [])
+            create_db()
+            tables = inspect(db.engine).get_table_names()
+
+        self.assertIn('questions', tables)
+        self.assertIn('categories', tables)
+
+    def wait_for_warm_up(self, app, timeout=5):
+        """Polls '/ready' until the background warm-up has succeeded"""
+        deadline = time.perf_counter() + timeout
+        while True:
+            res = app.test_client().get('/ready')
+            data = json.loads(res.data)
+            warm = res.status_code == 200 and data['warm_up_seconds'] is not None
+            if warm or time.perf_counter() > deadline:
+                return res, data
+            time.sleep(0.05)
+
+
 # Make the tests conveniently executable
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file